@@ -7,25 +7,24 @@ from enum import StrEnum
 
 from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
+import msgspec
 
 
-@dataclass
-class Battery(DataClassORJSONMixin):
+class Battery(msgspec.Struct, gc=False):
     """Battery model."""
 
-    identifier: str = field(metadata=field_options(alias="id"))
+    identifier: str = msgspec.field(name="id")
     name: str
     serial_number: str
 
 
-@dataclass
-class BatteryListResponse(DataClassORJSONMixin):
+class BatteryListResponse(msgspec.Struct, gc=False):
     """Battery list response."""
 
     batteries: list[Battery]
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomMode(DataClassORJSONMixin):
     """Custom mode."""
 
@@ -55,75 +54,58 @@ class SmartMode(StrEnum):
     SELF_USE = "SELF_USE"
 
 
-@dataclass
-class CurrentPower(DataClassORJSONMixin):
+class CurrentPower(msgspec.Struct, gc=False):
     """Current power model.
 
     All telemetry fields are optional because the API omits them when the
     battery is offline (then only ``onlineStatus`` is returned).
     """
 
-    online_status: OnlineStatus = field(metadata=field_options(alias="onlineStatus"))
-    state_of_charge: float | None = field(
-        metadata=field_options(alias="soc"), default=None
-    )
-    output_current: float | None = field(
-        metadata=field_options(alias="coc"), default=None
-    )
-    max_power: int | None = field(metadata=field_options(alias="smp"), default=None)
-    on_grid: bool | None = field(metadata=field_options(alias="onGrid"), default=None)
-    photovoltaic_power: int | None = field(
-        metadata=field_options(alias="ppv"), default=None
-    )
-    power_socket_output: int | None = field(
-        metadata=field_options(alias="pso"), default=None
-    )
-    is_dormant: bool | None = field(
-        metadata=field_options(alias="isDormancy"), default=None
-    )
+    online_status: OnlineStatus = msgspec.field(name="onlineStatus")
+    state_of_charge: float | None = msgspec.field(name="soc", default=None)
+    output_current: float | None = msgspec.field(name="coc", default=None)
+    max_power: int | None = msgspec.field(name="smp", default=None)
+    on_grid: bool | None = msgspec.field(name="onGrid", default=None)
+    photovoltaic_power: int | None = msgspec.field(name="ppv", default=None)
+    power_socket_output: int | None = msgspec.field(name="pso", default=None)
+    is_dormant: bool | None = msgspec.field(name="isDormancy", default=None)
 
 
-@dataclass
-class BatteryState(DataClassORJSONMixin):
+class BatteryState(msgspec.Struct, gc=False):
     """Battery state."""
 
-    serial_number: str = field(metadata=field_options(alias="sn"))
+    serial_number: str = msgspec.field(name="sn")
     name: str
-    online_status: OnlineStatus = field(metadata=field_options(alias="onlineStatus"))
-    current_power: CurrentPower = field(metadata=field_options(alias="currentPower"))
-    smart_mode: SmartMode = field(metadata=field_options(alias="smartMode"))
-    global_settings: GlobalSettings = field(
-        metadata=field_options(alias="globalSettings")
-    )
+    online_status: OnlineStatus = msgspec.field(name="onlineStatus")
+    current_power: CurrentPower = msgspec.field(name="currentPower")
+    smart_mode: SmartMode = msgspec.field(name="smartMode")
+    global_settings: GlobalSettings = msgspec.field(name="globalSettings")
 
 
-@dataclass
-class OnlineStatusResponse(DataClassORJSONMixin):
+class OnlineStatusResponse(msgspec.Struct, gc=False):
     """Online state."""
 
-    serial_number: str = field(metadata=field_options(alias="sn"))
-    online_status: OnlineStatus = field(metadata=field_options(alias="onlineStatus"))
+    serial_number: str = msgspec.field(name="sn")
+    online_status: OnlineStatus = msgspec.field(name="onlineStatus")
 
 
-@dataclass
-class PhotovoltaicData(DataClassORJSONMixin):
+class PhotovoltaicData(msgspec.Struct, gc=False):
     """Photovoltaic data."""
 
     name: str
     power: int
 
 
-@dataclass
-class GlobalSettings(DataClassORJSONMixin):
+class GlobalSettings(msgspec.Struct, gc=False):
     """Global settings."""
 
-    max_output: int = field(metadata=field_options(alias="maxOutput"))
-    max_output_limit: int = field(metadata=field_options(alias="maxOutputLimit"))
-    max_output_unlocked: bool = field(metadata=field_options(alias="maxOutputUnlocked"))
-    battery_upper_threshold: int = field(metadata=field_options(alias="batHighCap"))
-    battery_lower_threshold: int = field(metadata=field_options(alias="batUseCap"))
-    maximum_charge_power: int = field(metadata=field_options(alias="maxChargePower"))
-    standby_time: int = field(metadata=field_options(alias="standbyTime"))
+    max_output: int = msgspec.field(name="maxOutput")
+    max_output_limit: int = msgspec.field(name="maxOutputLimit")
+    max_output_unlocked: bool = msgspec.field(name="maxOutputUnlocked")
+    battery_upper_threshold: int = msgspec.field(name="batHighCap")
+    battery_lower_threshold: int = msgspec.field(name="batUseCap")
+    maximum_charge_power: int = msgspec.field(name="maxChargePower")
+    standby_time: int = msgspec.field(name="standbyTime")
 
 
 class UnitType(StrEnum):
@@ -142,7 +124,7 @@ class UnitUpdateStatus(StrEnum):
     DISCOVER_UPDATED = "DISCOVER_UPDATED"
 
 
-@dataclass
+@dataclass(slots=True)
 class UnitVersion(DataClassORJSONMixin):
     """Unit version information."""
 
@@ -153,7 +135,7 @@ class UnitVersion(DataClassORJSONMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Unit(DataClassORJSONMixin):
     """Unit model."""
 
@@ -165,14 +147,14 @@ class Unit(DataClassORJSONMixin):
     version: UnitVersion
 
 
-@dataclass
+@dataclass(slots=True)
 class UnitsResponse(DataClassORJSONMixin):
     """Units list response."""
 
     units: list[Unit]
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryUnit(DataClassORJSONMixin):
     """Battery unit."""
 
@@ -183,7 +165,7 @@ class BatteryUnit(DataClassORJSONMixin):
     power: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Version(DataClassORJSONMixin):
     """Version information."""
 
@@ -193,7 +175,7 @@ class Version(DataClassORJSONMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Checkpoint(DataClassORJSONMixin):
     """Checkpoint information."""
 
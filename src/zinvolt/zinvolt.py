@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from http import HTTPStatus
 import logging
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
-from aiohttp import ClientError, ClientSession
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
 from aiohttp.hdrs import METH_GET, METH_POST, METH_PUT
 from mashumaro.codecs.orjson import ORJSONDecoder
+import msgspec
 import orjson
-from yarl import URL
 
 from zinvolt.exceptions import ZinvoltAuthenticationError, ZinvoltError
 from zinvolt.models import (
@@ -23,18 +23,55 @@ from zinvolt.models import (
     CustomMode,
     GlobalSettings,
     OnlineStatus,
-    OnlineStatusResponse,
     PhotovoltaicData,
     SmartMode,
     Unit,
     UnitsResponse,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 VERSION = "1"
+USER_AGENT = f"python-zinvolt/{VERSION}"
 
 _LOGGER = logging.getLogger(__package__)
 
 HOST = "app.zinvolt.com"
+BASE_URL = f"https://{HOST}/api/public/v2/"
+
+# Responses are small JSON documents, but a larger read buffer keeps the
+# current-state and pv-data bodies from hitting aiohttp's 64 KiB backpressure.
+READ_BUFSIZE = 2 * 1024 * 1024
+KEEPALIVE_TIMEOUT = 75
+
+
+class _LoginResponse(msgspec.Struct, frozen=True, gc=False):
+    """Login response, only the token is used."""
+
+    token: str
+
+
+class _OnlineStatusRaw(msgspec.Struct, frozen=True, gc=False):
+    """Online status kept as a plain string for cheap polling."""
+
+    online_status: str = msgspec.field(name="onlineStatus")
+
+
+# Plain string, so the polling comparison skips the enum class lookup.
+_ONLINE = OnlineStatus.ONLINE.value
+
+_LOGIN_DEC = msgspec.json.Decoder(_LoginResponse)
+# Non-strict decoding keeps mashumaro's lenient coercion, e.g. accepting
+# 12.0 or "12" for an int field.
+_BATTERY_LIST_DEC = msgspec.json.Decoder(BatteryListResponse, strict=False)
+_BATTERY_STATE_DEC = msgspec.json.Decoder(BatteryState, strict=False)
+_ONLINE_STATUS_DEC = msgspec.json.Decoder(_OnlineStatusRaw)
+_PV_DEC = msgspec.json.Decoder(list[PhotovoltaicData], strict=False)
+_GLOBAL_SETTINGS_DEC = msgspec.json.Decoder(GlobalSettings, strict=False)
+_CUSTOM_MODES_DEC = ORJSONDecoder(list[CustomMode])
+_UNITS_DEC = ORJSONDecoder(UnitsResponse)
+_BATTERY_UNIT_DEC = ORJSONDecoder(BatteryUnit)
 
 
 @dataclass
@@ -45,6 +82,18 @@ class ZinvoltClient:
     session: ClientSession | None = None
     request_timeout: int = 10
     _close_session: bool = False
+    _headers: dict[str, str] = field(init=False, repr=False)
+    _headers_token: str | None = field(init=False, repr=False, default=None)
+    _timeout: ClientTimeout = field(init=False, repr=False)
+    _timeout_for: int | None = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        """Precompute the parts of every request that do not change."""
+        self._headers = {
+            "User-Agent": USER_AGENT,
+        }
+        self._update_authorization()
+        self._update_timeout()
 
     async def _request(
         self,
@@ -53,31 +102,29 @@ class ZinvoltClient:
         method: str = METH_GET,
         data: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
-    ) -> str:
+    ) -> bytes:
         """Handle a request to the Zinvolt API."""
-        url = URL.build(host=HOST, scheme="https").joinpath(f"api/public/v2/{uri}")
-        base_headers = {
-            "User-Agent": f"python-zinvolt/{VERSION}",
+        url = f"{BASE_URL}{uri}"
+        if self.token != self._headers_token:
+            self._update_authorization()
+        if self.request_timeout != self._timeout_for:
+            self._update_timeout()
+        kwargs: dict[str, Any] = {
+            "headers": self._headers if not headers else {**self._headers, **headers},
+            # Passed per request as well, since a caller-provided session has
+            # its own (usually much longer) default timeout.
+            "timeout": self._timeout,
         }
-        if self.token:
-            base_headers["Authorization"] = f"Bearer {self.token}"
+        if data is not None:
+            kwargs["json"] = data
 
         if self.session is None:
-            self.session = ClientSession()
+            self.session = self._create_session()
             self._close_session = True
 
-        if headers is None:
-            headers = {}
-
         try:
-            async with asyncio.timeout(self.request_timeout):
-                response = await self.session.request(
-                    method,
-                    url,
-                    headers=base_headers | headers,
-                    json=data,
-                )
-                body = await response.text()
+            response = await self.session.request(method, url, **kwargs)
+            body = await response.read()
         except TimeoutError as err:
             msg = f"Timeout occurred while connecting to {url}"
             raise ZinvoltError(msg) from err
@@ -92,7 +139,7 @@ class ZinvoltClient:
             # The API returns JSON error envelopes like
             # {"message": "...", "type": "...", "code": 400}; surface the
             # message when it's there so callers don't have to parse it.
-            detail = body
+            detail = body.decode(errors="replace")
             try:
                 payload = orjson.loads(body)  # pylint: disable=no-member
             except orjson.JSONDecodeError:  # pylint: disable=no-member
@@ -105,86 +152,124 @@ class ZinvoltClient:
 
         return body
 
-    async def _get(self, uri: str) -> str:
-        """Handle a GET request to the Zinvolt API."""
-        return await self._request(uri, method=METH_GET)
+    async def _fetch[T](self, uri: str, decode: Callable[[bytes], T]) -> T:
+        """Retrieve an endpoint and decode its response."""
+        return decode(await self._request(uri))
 
-    async def _put(self, uri: str, data: dict[str, Any]) -> str:
-        """Handle a PUT request to the Zinvolt API."""
-        return await self._request(uri, method=METH_PUT, data=data)
-
-    async def _post(self, uri: str, data: dict[str, Any]) -> str:
-        """Handle a POST request to the Zinvolt API."""
-        return await self._request(uri, method=METH_POST, data=data)
+    def _update_authorization(self) -> None:
+        """Sync the cached Authorization header with the current token."""
+        if self.token:
+            self._headers["Authorization"] = f"Bearer {self.token}"
+        else:
+            self._headers.pop("Authorization", None)
+        self._headers_token = self.token
+
+    def _update_timeout(self) -> None:
+        """Sync the cached ClientTimeout with the current request timeout."""
+        self._timeout = ClientTimeout(total=self.request_timeout)
+        self._timeout_for = self.request_timeout
+
+    def _create_session(self) -> ClientSession:
+        """Create a long-lived session for this client."""
+        return ClientSession(
+            connector=TCPConnector(limit=0, keepalive_timeout=KEEPALIVE_TIMEOUT),
+            read_bufsize=READ_BUFSIZE,
+            timeout=self._timeout,
+        )
 
     async def login(self, email: str, password: str) -> str:
         """Login to the Zinvolt API."""
-        result = await self._post("login", {"email": email, "password": password})
-        self.token = orjson.loads(result)["token"]  # pylint: disable=no-member
-        return self.token
+        result = await self._request(
+            "login",
+            method=METH_POST,
+            data={"email": email, "password": password},
+        )
+        token = _LOGIN_DEC.decode(result).token
+        self.token = token
+        return token
 
     async def get_batteries(self) -> list[Battery]:
         """Retrieve the list of batteries from the Zinvolt API."""
-        result = await self._get("system/batteries")
-        return BatteryListResponse.from_json(result).batteries
+        return (
+            await self._fetch("system/batteries", _BATTERY_LIST_DEC.decode)
+        ).batteries
 
     async def get_battery_status(self, battery_id: str) -> BatteryState:
         """Retrieve the battery status for the given battery ID."""
-        result = await self._get(f"system/{battery_id}/basic/current-state")
-        return BatteryState.from_json(result)
+        return await self._fetch(
+            f"system/{battery_id}/basic/current-state", _BATTERY_STATE_DEC.decode
+        )
 
     async def is_battery_online(self, battery_id: str) -> bool:
         """Retrieve the battery status for the given battery ID."""
-        result = await self._get(f"system/{battery_id}/basic/online-status")
-        return (
-            OnlineStatusResponse.from_json(result).online_status is OnlineStatus.ONLINE
+        status = await self._fetch(
+            f"system/{battery_id}/basic/online-status", _ONLINE_STATUS_DEC.decode
         )
+        return status.online_status == _ONLINE
 
     async def get_photovoltaic_data(self, battery_id: str) -> list[PhotovoltaicData]:
         """Retrieve the photovoltaic data for the given battery ID."""
-        result = await self._get(f"system/{battery_id}/basic/pv-data")
-        return ORJSONDecoder(list[PhotovoltaicData]).decode(result)
+        return await self._fetch(f"system/{battery_id}/basic/pv-data", _PV_DEC.decode)
 
     async def get_global_settings(self, battery_id: str) -> GlobalSettings:
         """Retrieve the global settings for the given battery ID."""
-        result = await self._get(f"system/{battery_id}/configuration/global-settings")
-        return GlobalSettings.from_json(result)
+        return await self._fetch(
+            f"system/{battery_id}/configuration/global-settings",
+            _GLOBAL_SETTINGS_DEC.decode,
+        )
+
+    async def get_full_state(
+        self, battery_id: str
+    ) -> tuple[BatteryState, list[PhotovoltaicData], GlobalSettings]:
+        """Retrieve the state, photovoltaic data and settings concurrently."""
+        # gather() returns a list at runtime, so build the tuple explicitly.
+        state, photovoltaic_data, global_settings = await asyncio.gather(
+            self.get_battery_status(battery_id),
+            self.get_photovoltaic_data(battery_id),
+            self.get_global_settings(battery_id),
+        )
+        return state, photovoltaic_data, global_settings
 
     async def get_custom_modes(self, battery_id: str) -> list[CustomMode]:
         """Retrieve the custom modes for the given battery ID."""
-        result = await self._get(f"system/{battery_id}/custom-mode")
-        return ORJSONDecoder(list[CustomMode]).decode(result)
+        return await self._fetch(
+            f"system/{battery_id}/custom-mode", _CUSTOM_MODES_DEC.decode
+        )
 
     async def get_units(self, battery_id: str) -> list[Unit]:
         """Retrieve all units for the given battery ID."""
-        result = await self._get(f"system/{battery_id}/unit")
-        return UnitsResponse.from_json(result).units
+        return (await self._fetch(f"system/{battery_id}/unit", _UNITS_DEC.decode)).units
 
     async def get_battery_unit(
         self, battery_id: str, battery_serial_number: str
     ) -> BatteryUnit:
         """Retrieve the battery unit for the given battery ID."""
-        result = await self._get(
-            f"system/{battery_id}/unit/battery/{battery_serial_number}"
+        return await self._fetch(
+            f"system/{battery_id}/unit/battery/{battery_serial_number}",
+            _BATTERY_UNIT_DEC.decode,
         )
-        return BatteryUnit.from_json(result)
 
     async def set_smart_mode(
         self, battery_id: str, smart_mode: SmartMode | str
     ) -> None:
         """Retrieve the custom modes for the given battery ID."""
         data: dict[str, Any] = {}
-        if not isinstance(smart_mode, SmartMode):
-            data["custom_mode_id"] = smart_mode
-            data["mode"] = SmartMode.CUSTOM
+        if isinstance(smart_mode, SmartMode):
+            data["mode"] = smart_mode.value
         else:
-            data["mode"] = smart_mode
-        await self._put(f"system/{battery_id}/operation/switch-smart-mode", data=data)
+            data["mode"] = SmartMode.CUSTOM.value
+            data["custom_mode_id"] = smart_mode
+        await self._request(
+            f"system/{battery_id}/operation/switch-smart-mode",
+            method=METH_PUT,
+            data=data,
+        )
 
     async def set_max_output(self, battery_id: str, max_output: int) -> None:
         """Set the maximum output for the given battery ID."""
-        await self._post(
+        await self._request(
             f"system/{battery_id}/configuration/global-settings",
+            method=METH_POST,
             data={
                 "max_output": max_output,
             },
@@ -192,8 +277,9 @@ class ZinvoltClient:
 
     async def set_lower_threshold(self, battery_id: str, lower_threshold: int) -> None:
         """Set the lower threshold for the given battery ID."""
-        await self._post(
+        await self._request(
             f"system/{battery_id}/configuration/global-settings",
+            method=METH_POST,
             data={
                 "bat_use_cap": lower_threshold,
             },
@@ -201,8 +287,9 @@ class ZinvoltClient:
 
     async def set_upper_threshold(self, battery_id: str, upper_threshold: int) -> None:
         """Set the upper threshold for the given battery ID."""
-        await self._post(
+        await self._request(
             f"system/{battery_id}/configuration/global-settings",
+            method=METH_POST,
             data={
                 "max_charge_power": upper_threshold,
             },
@@ -210,8 +297,9 @@ class ZinvoltClient:
 
     async def set_standby_time(self, battery_id: str, standby_time: int) -> None:
         """Set the standby time in minutes for the given battery ID."""
-        await self._post(
+        await self._request(
             f"system/{battery_id}/configuration/global-settings",
+            method=METH_POST,
             data={
                 "standby_time": standby_time,
             },
@@ -230,6 +318,9 @@ class ZinvoltClient:
             The ZinvoltClient object.
 
         """
+        if self.session is None:
+            self.session = self._create_session()
+            self._close_session = True
         return self
 
     async def __aexit__(self, *_exc_info: object) -> None:
@@ -1,7 +1,11 @@
 """Constants for tests."""
 
+from aiohttp import ClientTimeout
+
 VERSION = "1"
 
 HEADERS = {"User-Agent": f"python-zinvolt/{VERSION}", "Authorization": "Bearer token"}
 
 URL = "https://app.zinvolt.com/api/public/v2/"
+
+TIMEOUT = ClientTimeout(total=10)
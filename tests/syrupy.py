@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import asdict, is_dataclass
 from typing import TYPE_CHECKING, Any
 
+import msgspec
 from syrupy.extensions import AmberSnapshotExtension
 from syrupy.extensions.amber import AmberDataSerializer
 
@@ -42,6 +43,8 @@ class ZinvoltSnapshotSerializer(AmberDataSerializer):
         serializable_data = data
         if is_dataclass(type(data)):
             serializable_data = asdict(data)
+        elif isinstance(data, msgspec.Struct):
+            serializable_data = msgspec.structs.asdict(data)
 
         return super()._serialize(
             serializable_data,
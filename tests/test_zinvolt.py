@@ -4,19 +4,21 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+import aiohttp
+from aiohttp import ClientTimeout
 from aiohttp.hdrs import METH_GET, METH_POST, METH_PUT
 from aioresponses import aioresponses
 import pytest
 
+from zinvolt import ZinvoltClient
 from zinvolt.exceptions import ZinvoltAuthenticationError, ZinvoltError
 from zinvolt.models import SmartMode
 
 from . import load_fixture
-from .const import HEADERS, URL
+from .const import HEADERS, TIMEOUT, URL
 
 if TYPE_CHECKING:
     from syrupy import SnapshotAssertion
-    from zinvolt.zinvolt import ZinvoltClient
 
 
 async def test_login(
@@ -35,6 +37,7 @@ async def test_login(
         f"{URL}login",
         METH_POST,
         headers=HEADERS,
+        timeout=TIMEOUT,
         json={
             "email": "test@test.com",
             "password": "abc",
@@ -42,6 +45,79 @@ async def test_login(
     )
 
 
+async def test_login_authorizes_requests(responses: aioresponses) -> None:
+    """Test the token from logging in is sent on later requests."""
+    responses.post(
+        f"{URL}login",
+        status=200,
+        body='{"token": "new-token"}',
+    )
+    responses.get(
+        f"{URL}system/batteries",
+        status=200,
+        body=load_fixture("batteries.json"),
+    )
+    async with (
+        aiohttp.ClientSession() as session,
+        ZinvoltClient(session=session) as client,
+    ):
+        await client.login(email="test@test.com", password="abc")
+        await client.get_batteries()
+    responses.assert_called_with(
+        f"{URL}system/batteries",
+        METH_GET,
+        headers=HEADERS | {"Authorization": "Bearer new-token"},
+        timeout=TIMEOUT,
+    )
+
+
+async def test_token_assignment_authorizes_requests(
+    responses: aioresponses, client: ZinvoltClient
+) -> None:
+    """Test assigning the token directly is picked up by later requests."""
+    responses.get(
+        f"{URL}system/batteries",
+        status=200,
+        body=load_fixture("batteries.json"),
+        repeat=True,
+    )
+    client.token = "new-token"
+    await client.get_batteries()
+    responses.assert_called_with(
+        f"{URL}system/batteries",
+        METH_GET,
+        headers=HEADERS | {"Authorization": "Bearer new-token"},
+        timeout=TIMEOUT,
+    )
+    client.token = None
+    await client.get_batteries()
+    responses.assert_called_with(
+        f"{URL}system/batteries",
+        METH_GET,
+        headers={"User-Agent": HEADERS["User-Agent"]},
+        timeout=TIMEOUT,
+    )
+
+
+async def test_request_timeout_assignment(
+    responses: aioresponses, client: ZinvoltClient
+) -> None:
+    """Test changing request_timeout is picked up by later requests."""
+    responses.get(
+        f"{URL}system/batteries",
+        status=200,
+        body=load_fixture("batteries.json"),
+    )
+    client.request_timeout = 30
+    await client.get_batteries()
+    responses.assert_called_once_with(
+        f"{URL}system/batteries",
+        METH_GET,
+        headers=HEADERS,
+        timeout=ClientTimeout(total=30),
+    )
+
+
 async def test_set_smart_mode(responses: aioresponses, client: ZinvoltClient) -> None:
     """Test setting smart mode."""
     responses.put(
@@ -53,6 +129,7 @@ async def test_set_smart_mode(responses: aioresponses, client: ZinvoltClient) ->
         f"{URL}system/123123/operation/switch-smart-mode",
         METH_PUT,
         headers=HEADERS,
+        timeout=TIMEOUT,
         json={"mode": "DYNAMIC"},
     )
 
@@ -72,6 +149,7 @@ async def test_set_custom_smart_mode(
         f"{URL}system/123123/operation/switch-smart-mode",
         METH_PUT,
         headers=HEADERS,
+        timeout=TIMEOUT,
         json={
             "mode": "CUSTOM",
             "custom_mode_id": "EdxM2EsVNJVc6abhbVnbeby5bcq5EBXh",
@@ -157,7 +235,7 @@ async def test_retrieve_data(
         f"{URL}{endpoint}",
         METH_GET,
         headers=HEADERS,
-        json=None,
+        timeout=TIMEOUT,
     )
 
 
@@ -209,10 +287,49 @@ async def test_setting_global_settings(
         f"{URL}system/123123/configuration/global-settings",
         METH_POST,
         headers=HEADERS,
+        timeout=TIMEOUT,
         json=data,
     )
 
 
+async def test_lenient_number_decoding(
+    responses: aioresponses,
+    client: ZinvoltClient,
+) -> None:
+    """Integral floats and numeric strings still decode into int fields."""
+    responses.get(
+        f"{URL}system/123123/basic/pv-data",
+        status=200,
+        body='[{"name": "PV1", "power": 12.0}, {"name": "PV2", "power": "7"}]',
+    )
+    photovoltaic_data = await client.get_photovoltaic_data(battery_id="123123")
+    assert [data.power for data in photovoltaic_data] == [12, 7]
+    assert all(type(data.power) is int for data in photovoltaic_data)
+
+
+async def test_get_full_state(
+    responses: aioresponses,
+    client: ZinvoltClient,
+) -> None:
+    """Test retrieving the full state in one go."""
+    for endpoint, fixture in (
+        ("basic/current-state", "current_state"),
+        ("basic/pv-data", "pv_data"),
+        ("configuration/global-settings", "global_settings"),
+    ):
+        responses.get(
+            f"{URL}system/123123/{endpoint}",
+            status=200,
+            body=load_fixture(f"{fixture}.json"),
+        )
+    result = await client.get_full_state(battery_id="123123")
+    assert type(result) is tuple
+    state, photovoltaic_data, global_settings = result
+    assert state.serial_number == "ZVG011025120088"
+    assert [data.name for data in photovoltaic_data] == ["PV1", "PV2"]
+    assert global_settings.max_output == 800
+
+
 async def test_get_battery_status_offline(
     responses: aioresponses,
     client: ZinvoltClient,
@@ -254,6 +371,27 @@ async def test_request_error_status(
     assert expected in str(err.value)
 
 
+@pytest.mark.parametrize(
+    ("exception", "expected"),
+    [
+        (aiohttp.ServerTimeoutError(), "Timeout occurred"),
+        (TimeoutError(), "Timeout occurred"),
+        (aiohttp.ClientConnectionError("boom"), "Error occurred"),
+    ],
+    ids=["server_timeout", "timeout", "client_error"],
+)
+async def test_request_transport_error(
+    responses: aioresponses,
+    client: ZinvoltClient,
+    exception: Exception,
+    expected: str,
+) -> None:
+    """Timeouts and client errors raise ZinvoltError."""
+    responses.get(f"{URL}system/batteries", exception=exception)
+    with pytest.raises(ZinvoltError, match=expected):
+        await client.get_batteries()
+
+
 @pytest.mark.parametrize("status", [401, 403])
 async def test_request_authentication_error(
     responses: aioresponses,
@@ -268,3 +406,12 @@ async def test_request_authentication_error(
     )
     with pytest.raises(ZinvoltAuthenticationError):
         await client.get_batteries()
+
+
+async def test_session_created_on_enter() -> None:
+    """Entering the client without a session creates and closes its own."""
+    async with ZinvoltClient("token") as client:
+        assert client.session is not None
+        assert not client.session.closed
+        session = client.session
+    assert session.closed